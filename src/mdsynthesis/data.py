@@ -1,4 +1,5 @@
 from datreant.util import makedirs
+from datreant.names import TREANTDIR_NAME
 from functools import wraps
 import six
 import os
@@ -6,6 +7,10 @@ import os
 from .persistent_dict import npdata, pddata, pydata
 from .persistent_dict.core import DataFile
 
+# dataset file names, in the order they are looked for
+_datafiletypes = (pddata.pddatafile, npdata.npdatafile, pydata.pydatafile)
+_datafiletypeset = frozenset(_datafiletypes)
+
 
 class Data(object):
     """Interface to stored data.
@@ -27,15 +32,40 @@ class Data(object):
         if not data:
             out = "No Data"
         else:
-            out = agg + '\n'
-            out = out + majsep * seplength + '\n'
-            for datum in data:
-                out = out + "'{}'\n".format(datum)
+            # join once rather than re-copying the string for every dataset
+            lines = [agg, majsep * seplength]
+            lines.extend("'{}'".format(datum) for datum in data)
+            out = '\n'.join(lines) + '\n'
         return out
 
     def __iter__(self):
         return self.keys().__iter__()
 
+    def __contains__(self, handle):
+        """Check for a dataset with the given handle.
+
+        Only the files for *handle* are checked, instead of walking the
+        whole Treant as iteration over all keys would. As with
+        :meth:`keys`, handles must be normalized relative paths that stay
+        within the Treant and outside its state directory.
+
+        """
+        if not isinstance(handle, six.string_types):
+            return False
+
+        if os.path.isabs(handle) or handle != os.path.normpath(handle):
+            return False
+
+        if handle.split(os.sep)[0] in (os.pardir, TREANTDIR_NAME):
+            return False
+
+        try:
+            self._get_datafile(handle)
+        except KeyError:
+            return False
+
+        return True
+
     def _makedirs(self, p):
         """Make directories and all parents necessary.
 
@@ -67,8 +97,7 @@ class Data(object):
         """
         datafile = None
         datafiletype = None
-        for dfiletype in (pddata.pddatafile, npdata.npdatafile,
-                          pydata.pydatafile):
+        for dfiletype in _datafiletypes:
             dfile = os.path.join(self.treant.abspath, handle, dfiletype)
             if os.path.exists(dfile):
                 datafile = dfile
@@ -385,9 +414,10 @@ class Data(object):
         datasets = list()
         top = self.treant.abspath
         for root, dirs, files in os.walk(top):
-            if ((pddata.pddatafile in files) or
-                    (npdata.npdatafile in files) or
-                    (pydata.pydatafile in files)):
+            if root == top:
+                # the Treant's own state directory never holds datasets
+                dirs[:] = [d for d in dirs if d != TREANTDIR_NAME]
+            if not _datafiletypeset.isdisjoint(files):
                 datasets.append(os.path.relpath(root, start=top))
         datasets.sort()
         return datasets
@@ -6,6 +6,7 @@ Sim) in ways that are user-friendly.
 
 """
 import os
+from collections import OrderedDict
 from six import string_types
 import numpy as np
 from numpy.lib.utils import deprecate
@@ -105,7 +106,7 @@ class UniverseDefinition(Metadata):
             elif len(traj) == 1:
                 return traj[0][0]
             else:
-                return tuple([t[0] for t in traj])
+                return tuple(t[0] for t in traj)
 
     @trajectory.setter
     def trajectory(self, path):
@@ -149,6 +150,16 @@ class UniverseDefinition(Metadata):
 
     @kwargs.setter
     def kwargs(self, kwargs):
+        self._check_kwargs(kwargs)
+
+        with self._write:
+            self._statefile._state['kwargs'] = kwargs
+
+    @staticmethod
+    def _check_kwargs(kwargs):
+        """Raise an exception if `kwargs` cannot be stored.
+
+        """
         if kwargs is None:
             pass
         elif isinstance(kwargs, dict):
@@ -163,25 +174,65 @@ class UniverseDefinition(Metadata):
         else:
             raise TypeError("Must be a dictionary or ``None``")
 
+    def _define(self, topology, trajectory, kwargs):
+        """Set topology, trajectory and kwargs with a single write.
+
+        Each access to ``_write`` loads its own copy of the state, so the
+        individual setters cannot be grouped under one outer write; the
+        state is assigned directly instead.
+
+        Parameters
+        ----------
+        topology : str
+            Path to the topology file; ``None`` removes the topology.
+        trajectory : sequence of str
+            Paths to the trajectory files, in order; any sequence of paths
+            is accepted, including a ChainReader's ``filenames`` array.
+        kwargs : dict
+            Keyword arguments for building the Universe.
+
+        """
+        self._check_kwargs(kwargs)
+
         with self._write:
-            self._statefile._state['kwargs'] = kwargs
+            mdsdict = self._statefile._state
+            if topology is None:
+                mdsdict['topology'] = dict()
+            else:
+                mdsdict['topology'] = {'abspath': os.path.abspath(topology)}
+            mdsdict['trajectory'] = [
+                [os.path.abspath(traj)] for traj in trajectory]
+            mdsdict['kwargs'] = kwargs
 
     @property
     def _args(self):
         """dict to generate a universe"""
-        if self.topology is None:
+        # this is checked on every access to Sim.universe; take topology and
+        # trajectory from a single load of the state file
+        with self._read:
+            mdsdict = self._statefile._state
+
+        topstate = mdsdict['topology']
+        if not topstate:
             return None
         args = [
-            self.topology,
+            topstate['abspath'],
         ]
-        if self.trajectory is not None:
-            args.append(self.trajectory)
+
+        traj = mdsdict['trajectory']
+        if len(traj) == 1:
+            args.append(traj[0][0])
+        elif traj:
+            args.append(tuple(t[0] for t in traj))
         return args
 
     def _clear(self):
-        self._set_topology(None)
-        self._set_trajectory([])
-        self.kwargs = None
+        # reset everything in a single write instead of one per field
+        with self._write:
+            mdsdict = self._statefile._state
+            mdsdict['topology'] = dict()
+            mdsdict['trajectory'] = []
+            mdsdict['kwargs'] = None
 
     def update(self, universe):
         if universe is None:
@@ -190,7 +241,6 @@ class UniverseDefinition(Metadata):
             raise TypeError(
                 "Cannot set to {}; must be Universe".format(type(universe)))
         else:
-            self.topology = universe.filename
             try:  # ChainReader?
                 traj = universe.trajectory.filenames
             except AttributeError:
@@ -198,8 +248,22 @@ class UniverseDefinition(Metadata):
                     traj = [universe.trajectory.filename]
                 except AttributeError:  # Only topology
                     traj = []
-            self.trajectory = traj
-            self.kwargs = universe.kwargs
+
+            # re-setting the Universe the Sim is already defined with is
+            # common; leave the state file untouched in that case
+            with self._read:
+                mdsdict = self._statefile._state
+
+            unchanged = (
+                universe.filename is not None and
+                (mdsdict['topology'].get('abspath') ==
+                 os.path.abspath(universe.filename)) and
+                (mdsdict['trajectory'] ==
+                 [[os.path.abspath(t)] for t in traj]) and
+                mdsdict['kwargs'] == universe.kwargs)
+
+            if not unchanged:
+                self._define(universe.filename, traj, universe.kwargs)
 
 
 class AtomSelections(Metadata):
@@ -223,9 +287,12 @@ class AtomSelections(Metadata):
         self._parent = parent
 
     def __repr__(self):
+        with self._read:
+            seldict = self._statefile._state
+
         return "<AtomSelections({})>".format(
-            {x: self.get(x)
-             for x in self.keys()})
+            {x: self._deserialize(seldef)
+             for x, seldef in seldict.items()})
 
     def __getitem__(self, handle):
         """Get selection for given handle.
@@ -278,6 +345,36 @@ class AtomSelections(Metadata):
             given and their order will be preserved, which is useful for e.g.
             structural alignments.
 
+        """
+        outsel = self._serialize(selection)
+
+        with self._write:
+            seldict = self._statefile._state
+            seldict[handle] = outsel
+
+    def _update(self, selections):
+        """Store several atom selections with a single write.
+
+        Parameters
+        ----------
+        selections : dict
+            Selections keyed by handle; each value is given as it would be
+            to ``AtomSelections[handle] = value``.
+
+        """
+        outsels = dict()
+        for handle, selection in selections.items():
+            if isinstance(selection, (string_types, np.ndarray)):
+                selection = [selection]
+            outsels[handle] = self._serialize(selection)
+
+        with self._write:
+            self._statefile._state.update(outsels)
+
+    @staticmethod
+    def _serialize(selection):
+        """Convert a sequence of selection pieces to its stored form.
+
         """
         if len(selection) == 1:
             sel = selection[0]
@@ -296,9 +393,7 @@ class AtomSelections(Metadata):
                     raise ValueError("Selections must be strings, arrays of "
                                      "atom indices, or tuples/lists of these.")
 
-        with self._write:
-            seldict = self._statefile._state
-            seldict[handle] = outsel
+        return outsel
 
     def remove(self, *handle):
         """Remove an atom selection for the universe.
@@ -313,7 +408,8 @@ class AtomSelections(Metadata):
         """
         with self._write:
             seldict = self._statefile._state
-            for item in handle:
+            # a handle given more than once is only removed once
+            for item in OrderedDict.fromkeys(handle):
                 try:
                     del seldict[item]
                 except KeyError:
@@ -353,25 +449,27 @@ class AtomSelections(Metadata):
         # - a list of strings
         # - a list of indices
 
+        # each access to the parent's universe re-reads its definition from
+        # disk, so resolve it once up front
+        universe = self._parent.universe
+
         if isinstance(sel, string_types):
             # if we have a single string
-            ag = self._parent.universe.select_atoms(sel)
-        elif all([isinstance(i, int) for i in sel]):
-            # if we have a single array_like of indices
-            ag = self._parent.universe.atoms[sel]
+            ag = universe.select_atoms(sel)
+        elif isinstance(sel, np.ndarray):
+            # if we have a single array of indices
+            ag = universe.atoms[sel]
         else:
-            ag = None
+            # gather indices for each piece and concatenate once at the end;
+            # growing the AtomGroup piece by piece copies it every time
+            indices = list()
             for item in sel:
                 if isinstance(item, string_types):
-                    if ag:
-                        ag += self._parent.universe.select_atoms(item)
-                    else:
-                        ag = self._parent.universe.select_atoms(item)
+                    indices.append(universe.select_atoms(item).indices)
                 else:
-                    if ag:
-                        ag += self._parent.universe.atoms[item]
-                    else:
-                        ag = self._parent.universe.atoms[item]
+                    indices.append(universe.atoms[item].indices)
+
+            ag = universe.atoms[np.concatenate(indices)]
 
         return ag
 
@@ -399,10 +497,17 @@ class AtomSelections(Metadata):
         except KeyError:
             raise KeyError("No such selection '{}'".format(handle))
 
+        return self._deserialize(seldef)
+
+    @staticmethod
+    def _deserialize(seldef):
+        """Convert a stored selection definition to its user-facing form.
+
+        """
         if isinstance(seldef, string_types):
             # if we have a single string
             out = seldef
-        elif all([isinstance(i, int) for i in seldef]):
+        elif all(isinstance(i, int) for i in seldef):
             # if we have a single list of indices
             out = np.array(seldef)
         else:
@@ -56,7 +56,7 @@ class npDataFile(File):
                 the selected data
         """
         with self.read():
-            return self.handle[key].value
+            return self.handle[key][()]
 
     def del_data(self, key, **kwargs):
         """Delete a stored data object.
@@ -1,11 +1,10 @@
 #! /usr/bin/env python
 import mdsynthesis as mds
-import MDAnalysis as mda
 import warnings
 import json
+import multiprocessing as mp
 from os import path
 from glob import glob
-import six
 
 
 def convert(folder):
@@ -27,21 +26,22 @@ def convert(folder):
     # update universe definition
     udef = old_sim['universedef']
     if udef['topology']:
-        args = [
+        # store the definition directly; building a Universe here would load
+        # the topology and trajectory only to read their paths back out
+        sim.universedef._define(
             udef['topology']['abspath'],
-        ]
-        if udef['trajectory']:
-            args.append([abspath for abspath, relpath in udef['trajectory']])
-        u = mda.Universe(*args, **udef['kwargs'])
-        sim.universe = u
+            [abspath for abspath, relpath in udef['trajectory']],
+            udef['kwargs'])
 
     # update atom selection
     try:
         atom_sel = old_sim['atomselections']
-        for key, val in six.iteritems(atom_sel):
-            sim.atomselections[key] = val
     except KeyError:
         pass
+    else:
+        # store all selections with one write of the state file rather than
+        # one per selection
+        sim.atomselections._update(atom_sel)
 
 
 def main():
@@ -54,10 +54,29 @@ def main():
         metavar="DIRECTORY",
         nargs="+",
         help="one or more directories that are being processed")
+    parser.add_argument(
+        "-n",
+        "--processes",
+        type=int,
+        default=1,
+        help="number of processes to convert directories with")
     args = parser.parse_args()
 
-    for dir in args.directories:
-        convert(dir)
+    if args.processes > 1:
+        # hand out directories in chunks so each worker gets a batch per
+        # round-trip instead of one directory at a time
+        chunksize = max(1, len(args.directories) // (args.processes * 4))
+        pool = mp.Pool(processes=args.processes)
+        try:
+            for _ in pool.imap_unordered(convert, args.directories,
+                                         chunksize=chunksize):
+                pass
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for dir in args.directories:
+            convert(dir)
 
 
 if __name__ == '__main__':
@@ -6,7 +6,7 @@ import json
 from MDAnalysisTests.datafiles import PDB, XTC
 
 import mdsynthesis as mds
-from mdsynthesis.scripts.mds_06to1 import convert
+from mdsynthesis.scripts.mds_06to1 import convert, main
 
 
 @pytest.fixture
@@ -98,3 +98,23 @@ def test_convert_no_atomselection(old_sim, tmpdir):
         'topology']['abspath']
     assert sim.universedef.kwargs == old_sim['mdsynthesis']['universedef'][
         'kwargs']
+
+
+def test_main_processes(old_sim, tmpdir, monkeypatch):
+    # only the dispatch over directories is under test here
+    old_sim['mdsynthesis']['universedef']['topology'] = {}
+
+    sim_folders = [str(tmpdir.mkdir(name)) for name in ('a', 'b', 'c')]
+    for sim_folder in sim_folders:
+        with open(path.join(sim_folder, 'Sim-uuid.json'), 'w') as fh:
+            json.dump(old_sim, fh)
+
+    monkeypatch.setattr('sys.argv',
+                        ['mds_06to1', '--processes', '2'] + sim_folders)
+    main()
+
+    for sim_folder in sim_folders:
+        sim = mds.Sim(sim_folder)
+        assert sim.tags == old_sim['tags']
+        assert sim.atomselections['aa'] == old_sim['mdsynthesis'][
+            'atomselections']['aa']
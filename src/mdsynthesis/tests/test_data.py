@@ -4,6 +4,8 @@ import pytest
 import os
 import py
 
+from datreant.names import TREANTDIR_NAME
+
 import mdsynthesis as mds
 from mdsynthesis.tests import data
 
@@ -56,6 +58,27 @@ class TestTreant:
                 np.testing.assert_equal(treant.data[self.handle],
                                         datastruct)
 
+            def test_contains_data(self, treant, datastruct):
+                assert self.handle not in treant.data
+
+                treant.data.add(self.handle, datastruct)
+                assert self.handle in treant.data
+                assert 'not' + self.handle not in treant.data
+
+                # only names as keys() would list them
+                assert self.handle + '/' not in treant.data
+                assert os.path.join('.', self.handle) not in treant.data
+                assert os.path.join('..', treant.name,
+                                    self.handle) not in treant.data
+
+                hidden = os.path.join(TREANTDIR_NAME, self.handle)
+                treant.data.add(hidden, datastruct)
+                assert hidden not in treant.data.keys()
+                assert hidden not in treant.data
+
+                treant.data.remove(self.handle)
+                assert self.handle not in treant.data
+
         class PandasMixin(DataMixin):
             """Mixin class for pandas tests"""
             datafile = mds.persistent_dict.pddata.pddatafile
@@ -53,6 +53,24 @@ class TestSim(TestTreant):
             assert treant.universedef.topology == GRO
             assert treant.universedef.trajectory == XTC
 
+        def test_set_same_universe(self, treant, monkeypatch):
+            """Setting the Universe already defined should not write state"""
+            u = mda.Universe(GRO, XTC)
+            treant.universe = u
+
+            writes = []
+            monkeypatch.setattr(treant.universedef, '_define',
+                                lambda *args: writes.append(args))
+
+            treant.universe = u
+            assert len(writes) == 0
+            assert treant.universedef.topology == GRO
+            assert treant.universedef.trajectory == XTC
+
+            # a different Universe must still be written
+            treant.universe = mda.Universe(PDB, XTC)
+            assert len(writes) == 1
+
         def test_set_universe_only_topology(self, treant):
             """Test setting the Universe to a topology-only universe"""
             u = mda.Universe(PSF)
@@ -177,6 +195,19 @@ class TestSim(TestTreant):
             with pytest.raises(KeyError):
                 del treant.atomselections['CA']
 
+        def test_remove_selections(self, treant):
+            """Test removing several selections at once"""
+            treant.atomselections.add('CA', 'protein and name CA')
+            treant.atomselections.add('someres', 'resid 12')
+            treant.atomselections.add('moreres', 'resid 12:20')
+
+            # repeated handles are only removed once
+            treant.atomselections.remove('CA', 'someres', 'CA')
+
+            assert 'CA' not in treant.atomselections
+            assert 'someres' not in treant.atomselections
+            assert 'moreres' in treant.atomselections
+
         def test_selection_keys(self, treant):
             treant.atomselections.add('CA', 'protein and name CA')
             treant.atomselections.add('someres', 'resid 12')